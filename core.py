@@ -1,38 +1,239 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 import configparser
 import hashlib
+import errno
 import json
 import logging
+import os
 from pathlib import Path
 import shutil
 import time
 import subprocess
-from typing import Callable, TypedDict
+from typing import Callable, Iterable, Iterator, TypedDict
 import psutil
 import sys
 
 from utils import get_exe_path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    # Kernel-side file copy that keeps timestamps/attributes (block-clones on ReFS/Dev Drive)
+    _CopyFileW = ctypes.WinDLL("kernel32", use_last_error=True).CopyFileW
+    _CopyFileW.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.BOOL)
+    _CopyFileW.restype = wintypes.BOOL
+
 logger = logging.getLogger(__name__)
 
 
+def _json_loads(data: bytes):
+    """Decode JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode compact UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # Compact output keeps json on its C encoder (indent forces the pure-Python path)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+_SMALL_FILE_SIZE = 64 * 1024  # Below this, hash in one read instead of streaming
+
+
+def hash_file(file_path: Path) -> str:
+    """Calculate SHA256 hash of a file, streaming large files instead of reading them whole."""
+    with open(file_path, 'rb', buffering=0) as f:
+        # file_digest allocates a 256 KiB buffer per call; small files fit in a single read
+        if os.fstat(f.fileno()).st_size < _SMALL_FILE_SIZE:
+            return hashlib.sha256(f.read()).hexdigest()
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+def hash_files(file_paths: Iterable[Path], hash_func: Callable[[Path], str] = hash_file) -> dict[Path, str]:
+    """Hash several files concurrently (hashlib releases the GIL while hashing)."""
+    unique_paths = list(dict.fromkeys(file_paths))
+    if len(unique_paths) <= 1:
+        return {path: hash_func(path) for path in unique_paths}
+    # Capped: more concurrent readers than this only makes spinning disks seek
+    workers = min(8, os.cpu_count() or 1, len(unique_paths))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(unique_paths, executor.map(hash_func, unique_paths)))
+
+
+_PREFIX_SIZE = 4096  # Bytes compared by _same_prefix before committing to a full hash
+
+
+def _same_prefix(a: Path, b: Path) -> bool:
+    """Cheap pre-check for equal-size files: False if their first bytes differ (no need to hash)."""
+    with open(a, 'rb', buffering=0) as fa, open(b, 'rb', buffering=0) as fb:
+        return fa.read(_PREFIX_SIZE) == fb.read(_PREFIX_SIZE)
+
+
+def _iter_file_entries(root: Path, predicate: Callable[[str], bool]) -> Iterator[os.DirEntry[str]]:
+    """Recursively yield DirEntry objects for files under root whose name satisfies predicate.
+    
+    Walks with os.scandir so directory entries are tested by name using cached
+    DirEntry type info (and on Windows, DirEntry.stat() needs no extra syscall).
+    Traversal order matches Path.rglob (pre-order, files of a directory before
+    its subdirectories).
+    """
+    stack = [root]
+    while stack:
+        subdirs: list[str] = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif predicate(entry.name) and entry.is_file():
+                        yield entry
+        except OSError:
+            continue  # Unreadable or missing directory, like rglob
+        stack.extend(reversed(subdirs))
+
+
+def _iter_files(root: Path, predicate: Callable[[str], bool]) -> Iterator[Path]:
+    """Recursively yield paths of files under root whose name satisfies predicate."""
+    for entry in _iter_file_entries(root, predicate):
+        yield Path(entry.path)
+
+
+def _mod_name_filter(ext: str) -> Callable[[str], bool]:
+    """Build the mod file name predicate once: non-hidden and ending with ext.
+    
+    Case rules follow the OS, like Path.rglob (case-insensitive on Windows).
+    """
+    if os.path.normcase("A") == "a":
+        ext = ext.lower()
+        n = len(ext)
+        # Exact-case suffix first; otherwise lowercase just the suffix, not the whole name
+        return lambda name: (name.endswith(ext) or name[-n:].lower() == ext) and not name.startswith(".")
+    return lambda name: name.endswith(ext) and not name.startswith(".")
+
+
+def _is_backup_name(name: str) -> bool:
+    """Check if a file name looks like a backup ({original_name}.backup.{path_parts})."""
+    return ".backup." in name
+
+
+def _copy_data(src: Path, dst: Path) -> None:
+    """Copy file contents, in-kernel via copy_file_range where available (may reflink on CoW filesystems)."""
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining == 0:
+                    return
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                raise
+    shutil.copyfile(src, dst)
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy src over dst (with metadata) through a temp file and os.replace.
+    
+    dst is swapped atomically, so a crash can't leave it half-written and any
+    hard link to the previous dst (e.g. a backup) keeps the old content.
+    """
+    tmp = dst.with_name(dst.name + ".tmp")
+    try:
+        if sys.platform == "win32":
+            # shutil on 3.11 would copy through a 1 MiB user-space loop plus copystat
+            if not _CopyFileW(str(src), str(tmp), False):
+                raise ctypes.WinError(ctypes.get_last_error())
+        else:
+            _copy_data(src, tmp)
+            shutil.copystat(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _snapshot_file(src: Path, dst: Path) -> None:
+    """Make dst a read-only snapshot of src: hard link when possible (no data copied), else copy."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        _fast_copy(src, dst)
+
+
+def _move_file(src: Path, dst: Path) -> None:
+    """Move src over dst with an atomic rename, copying across devices."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        _fast_copy(src, dst)
+        src.unlink()
+
+
 class ModStatusEntry(TypedDict):
     """Type definition for mod status entry in JSON."""
     path: str  # relative path from mods_dir
     hash: str  # SHA256 hash of the current mod file
     applied_hash: str  # hash of mod that was applied to game (empty if not applied)
     enabled: bool
+    size: int  # file size when hash was computed
+    mtime_ns: int  # file mtime when hash was computed
+    applied_size: int  # game file size right after the mod was applied (0 if not applied)
+    applied_mtime_ns: int  # game file mtime right after the mod was applied (0 if not applied)
+
+
+# Last parsed/saved contents of each status file, keyed by (size, mtime_ns), shared across
+# ModsStatusManager instances so an unchanged file is not re-read on every loader construction
+_status_cache: dict[Path, tuple[tuple[int, int], list[ModStatusEntry]]] = {}
+
+
+@dataclass(slots=True)
+class _FileCtx:
+    """Per-file data computed once at the start of an operation."""
+    path: Path
+    rel_path: str  # relative posix path from mods_dir, used as the status key
+    stat: os.stat_result
+
+
+def _hash_is_current(entry: ModStatusEntry | None, st: os.stat_result) -> bool:
+    """Check if an entry's stored hash was computed from a file with this size/mtime."""
+    return entry is not None and entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns
+
+
+_UNSET = object()  # Marks an option whose parsed value is not cached yet
+
 
 class _ConfigOptionBase:
     def __init__(self, config_parent: "Config", section: str, option: str) -> None:
         self.config_parent = config_parent
         self.section = section
         self.option = option
+        # Parsed value from the last get(); reset by set() and Config.reload()
+        self._cached = _UNSET
+        config_parent._options.append(self)
 
     def _get_raw(self) -> str | None:
-        try:
-            val = self.config_parent.config.get(self.section, self.option)
-        except (configparser.NoSectionError, configparser.NoOptionError):
+        if not self.config_parent.config.has_option(self.section, self.option):
             return None
+        val = self.config_parent.config.get(self.section, self.option)
         if not val or val.strip() == "":
             return None
         return val
@@ -41,11 +242,16 @@ class _ConfigOptionBase:
         if not self.config_parent.config.has_section(self.section):
             self.config_parent.config.add_section(self.section)
         self.config_parent.config.set(self.section, self.option, value)
-        self.config_parent._save_config()
+        self._cached = _UNSET
+        self.config_parent._dirty = True
+        if self.config_parent._batch == 0:
+            self.config_parent._save_config()
 
 class StringConfig(_ConfigOptionBase):
     def get(self) -> str | None:
-        return self._get_raw()
+        if self._cached is _UNSET:
+            self._cached = self._get_raw()
+        return self._cached
 
     def set(self, value: str) -> str:
         self._set_raw(value)
@@ -53,6 +259,11 @@ class StringConfig(_ConfigOptionBase):
 
 class BoolConfig(_ConfigOptionBase):
     def get(self) -> bool | None:
+        if self._cached is _UNSET:
+            self._cached = self._parse()
+        return self._cached
+
+    def _parse(self) -> bool | None:
         val = self._get_raw()
         if val is None:
             return None
@@ -69,12 +280,16 @@ class BoolConfig(_ConfigOptionBase):
 
 class Config:
     def __init__(self, config_file: str = 'config.ini'):
-        self.config = configparser.ConfigParser()
+        # Values are plain strings (paths may contain '%'), so no interpolation
+        self.config = configparser.ConfigParser(interpolation=None)
         config_path = Path(config_file)
         if not config_path.is_absolute():
             self.config_file = get_exe_path(config_file)
         else:
             self.config_file = config_path
+        self._dirty = False
+        self._batch = 0
+        self._options: list[_ConfigOptionBase] = []
         self._load_config()
 
         self.GameExePath = StringConfig(self, 'Directory', 'game_exe_path')
@@ -88,14 +303,31 @@ class Config:
 
     def reload(self) -> None:
         self.config.read(self.config_file, encoding='utf-8')
+        for option in self._options:
+            option._cached = _UNSET
 
     def _load_config(self) -> None:
         if self.config_file.exists():
             self.config.read(self.config_file, encoding='utf-8')
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer writing the INI file until the outermost batch exits."""
+        self._batch += 1
+        try:
+            yield
+        finally:
+            self._batch -= 1
+            if self._batch == 0 and self._dirty:
+                self._save_config()
+
     def _save_config(self) -> None:
-        with open(self.config_file, 'w', encoding='utf-8') as configfile:
+        # Write to a temp file and swap it in so a crash never leaves a half-written INI
+        tmp_file = self.config_file.with_name(self.config_file.name + ".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as configfile:
             self.config.write(configfile)
+        os.replace(tmp_file, self.config_file)
+        self._dirty = False
 
 
 class ModsStatusManager:
@@ -104,28 +336,63 @@ class ModsStatusManager:
     def __init__(self, mods_dir: Path, mod_extension: str) -> None:
         self.mods_dir = mods_dir
         self.mod_extension = mod_extension
+        self._is_mod_name = _mod_name_filter(mod_extension)
+        # str(mods_dir) plus separator: the prefix of every DirEntry.path the walker yields
+        self._mods_prefix = os.path.join(str(mods_dir), "")
         self.status_file = get_exe_path("ModsStatus.json")
-        self._status_data: list[ModStatusEntry] = []
+        # Entries keyed by relative path (insertion-ordered, saved as a JSON list)
+        self._status_data: dict[str, ModStatusEntry] = {}
+        # Secondary index: file name -> entries with that name (for conflict checks)
+        self._by_name: dict[str, list[ModStatusEntry]] = {}
         self._dirty = False
+        self._batch_depth = 0
+        # Mod file paths seen by the last sync_with_files walk
+        self.scanned_files: list[Path] = []
         self.load()
     
     def load(self) -> None:
-        """Load status data from JSON file."""
-        if self.status_file.exists():
-            try:
-                with open(self.status_file, 'r', encoding='utf-8') as f:
-                    self._status_data = json.load(f)
-                logger.debug(f"Loaded {len(self._status_data)} mod entries from {self.status_file}")
-            except (json.JSONDecodeError, IOError) as e:
-                logger.error(f"Failed to load mod status file: {e}")
-                self._status_data = []
+        """Load status data from JSON file (or the cached copy if the file is unchanged)."""
+        try:
+            st = self.status_file.stat()
+        except FileNotFoundError:
+            self._status_data = {}
         else:
-            self._status_data = []
+            key = (st.st_size, st.st_mtime_ns)
+            cached = _status_cache.get(self.status_file)
+            if cached is not None and cached[0] == key:
+                self._status_data = {entry["path"]: entry.copy() for entry in cached[1]}
+                logger.debug(f"Loaded {len(self._status_data)} mod entries from cache")
+            else:
+                try:
+                    self._status_data = {entry["path"]: entry for entry in _json_loads(self.status_file.read_bytes())}
+                    _status_cache[self.status_file] = (key, [entry.copy() for entry in self._status_data.values()])
+                    logger.debug(f"Loaded {len(self._status_data)} mod entries from {self.status_file}")
+                except (json.JSONDecodeError, IOError) as e:
+                    logger.error(f"Failed to load mod status file: {e}")
+                    self._status_data = {}
+        self._rebuild_name_index()
+    
+    def _rebuild_name_index(self) -> None:
+        """Rebuild the file name -> entries index from _status_data."""
+        self._by_name = {}
+        for rel_path, entry in self._status_data.items():
+            self._by_name.setdefault(rel_path.rpartition("/")[2], []).append(entry)
+    
+    def _add_entry(self, entry: ModStatusEntry) -> None:
+        """Add a new entry to _status_data and the name index."""
+        rel_path = entry["path"]
+        self._status_data[rel_path] = entry
+        self._by_name.setdefault(rel_path.rpartition("/")[2], []).append(entry)
     
     def save(self) -> None:
         """Save status data to JSON file."""
-        with open(self.status_file, 'w', encoding='utf-8') as f:
-            json.dump(self._status_data, f, indent=2, ensure_ascii=False)
+        entries = list(self._status_data.values())
+        # Write to a temp file and swap it in so a crash never leaves a truncated status file
+        tmp_file = self.status_file.with_name(self.status_file.name + ".tmp")
+        tmp_file.write_bytes(_json_dumps(entries))
+        os.replace(tmp_file, self.status_file)
+        st = self.status_file.stat()
+        _status_cache[self.status_file] = ((st.st_size, st.st_mtime_ns), [entry.copy() for entry in entries])
         self._dirty = False
         logger.debug(f"Saved {len(self._status_data)} mod entries to {self.status_file}")
     
@@ -134,16 +401,32 @@ class ModsStatusManager:
         self._dirty = True
     
     def save_if_dirty(self) -> None:
-        """Save only if data has been modified."""
-        if self._dirty:
+        """Save only if data has been modified and no batch is in progress."""
+        if self._dirty and self._batch_depth == 0:
             self.save()
     
+    @contextmanager
+    def batched(self) -> Iterator[None]:
+        """Defer saving until the outermost batch exits, then save once if dirty."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            self.save_if_dirty()
+    
     def _get_file_hash(self, file_path: Path) -> str:
         """Calculate SHA256 hash of a file."""
-        return hashlib.sha256(file_path.read_bytes()).hexdigest()
+        return hash_file(file_path)
     
     def _get_relative_path(self, file_path: Path) -> str:
         """Get relative path from mods_dir as posix string."""
+        # Plain prefix strip for paths built from mods_dir (the usual case); relative_to
+        # handles everything else (e.g. different case on Windows) and raises as before
+        path_str = str(file_path)
+        if path_str.startswith(self._mods_prefix):
+            rel_path = path_str[len(self._mods_prefix):]
+            return rel_path.replace(os.sep, "/") if os.sep != "/" else rel_path
         return file_path.relative_to(self.mods_dir).as_posix()
     
     def sync_with_files(self) -> list[ModStatusEntry]:
@@ -154,119 +437,133 @@ class ModsStatusManager:
         - Update hash if file content changed
         - Return list of orphaned enabled mods (enabled but file deleted/moved)
         """
-        pattern = f"*{self.mod_extension}"
-        current_files = list(self.mods_dir.rglob(pattern))
-        
-        # Filter out backup files (hidden files starting with dot)
-        current_files = [f for f in current_files if not f.name.startswith(".")]
-        
-        # Build a dict of current entries by path for quick lookup
-        existing_entries: dict[str, ModStatusEntry] = {
-            entry["path"]: entry for entry in self._status_data
-        }
+        # Backup files (hidden files starting with dot) are skipped by the walker
+        # Relative paths are sliced off DirEntry.path, avoiding Path.relative_to per file
+        prefix_len = len(self._mods_prefix)
+        current_files: list[_FileCtx] = []
+        for dir_entry in _iter_file_entries(self.mods_dir, self._is_mod_name):
+            rel_path = dir_entry.path[prefix_len:]
+            if os.sep != "/":
+                rel_path = rel_path.replace(os.sep, "/")
+            current_files.append(_FileCtx(Path(dir_entry.path), rel_path, dir_entry.stat()))
+        self.scanned_files = [ctx.path for ctx in current_files]
         
-        # Build set of current file paths
-        current_paths = {self._get_relative_path(f) for f in current_files}
-        
-        # Detect orphaned mods before removal (enabled but file no longer exists)
+        # Single pass over existing entries: keep those still on disk, collect enabled
+        # ones whose file is gone as orphans (dropped from the store, so no copy needed)
+        current_paths = {ctx.rel_path for ctx in current_files}
         orphaned_mods: list[ModStatusEntry] = []
-        for entry in self._status_data:
-            if entry["path"] not in current_paths and entry["enabled"]:
-                orphaned_mods.append(entry.copy())
-        
-        # Remove entries for files that no longer exist
-        self._status_data = [
-            entry for entry in self._status_data
-            if entry["path"] in current_paths
-        ]
+        kept: dict[str, ModStatusEntry] = {}
+        for rel_path, entry in self._status_data.items():
+            if rel_path in current_paths:
+                kept[rel_path] = entry
+            elif entry["enabled"]:
+                orphaned_mods.append(entry)
+        changed = len(kept) != len(self._status_data)
+        if changed:
+            self._status_data = kept
+            self._rebuild_name_index()
         
-        # Rebuild existing_entries after removal
-        existing_entries = {
-            entry["path"]: entry for entry in self._status_data
-        }
+        # Only rehash files whose size/mtime changed since the stored hash was computed
+        stale_files: list[_FileCtx] = []
+        for ctx in current_files:
+            entry = self._status_data.get(ctx.rel_path)
+            # Ensure applied_hash field exists (migration from old format)
+            if entry is not None and "applied_hash" not in entry:
+                entry["applied_hash"] = ""
+                changed = True
+            if not _hash_is_current(entry, ctx.stat):
+                stale_files.append(ctx)
+        new_hashes = hash_files([ctx.path for ctx in stale_files], self._get_file_hash)
         
-        # Process each current file
-        for file_path in current_files:
-            rel_path = self._get_relative_path(file_path)
-            current_hash = self._get_file_hash(file_path)
-            
-            if rel_path in existing_entries:
-                entry = existing_entries[rel_path]
-                # Check if file content changed
-                if entry["hash"] != current_hash:
-                    # File changed - update hash (keep enabled status, applied_hash stays for comparison)
-                    entry["hash"] = current_hash
-                # Ensure applied_hash field exists (migration from old format)
-                if "applied_hash" not in entry:
-                    entry["applied_hash"] = ""
+        # Update changed files and add new ones
+        for ctx in stale_files:
+            st = ctx.stat
+            entry = self._status_data.get(ctx.rel_path)
+            if entry is not None:
+                # File changed - update hash (keep enabled status, applied_hash stays for comparison)
+                self.update_hash(entry, new_hashes[ctx.path], st)
             else:
                 # New file - add with enabled=False (default disabled)
                 new_entry: ModStatusEntry = {
-                    "path": rel_path,
-                    "hash": current_hash,
+                    "path": ctx.rel_path,
+                    "hash": new_hashes[ctx.path],
                     "applied_hash": "",
-                    "enabled": False
+                    "enabled": False,
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                    "applied_size": 0,
+                    "applied_mtime_ns": 0
                 }
-                self._status_data.append(new_entry)
+                self._add_entry(new_entry)
         
-        self.mark_dirty()
+        if changed or stale_files:
+            self.mark_dirty()
         return orphaned_mods
     
-    def get_status(self, file_path: Path) -> bool:
-        """Get enabled status for a mod file. Returns False if not found."""
-        rel_path = self._get_relative_path(file_path)
-        for entry in self._status_data:
-            if entry["path"] == rel_path:
-                return entry["enabled"]
-        return False  # Default to disabled if not found
+    def get_status(self, file_path: Path, rel_path: str | None = None) -> bool:
+        """Get enabled status for a mod file. Returns False if not found.
+        
+        Pass rel_path when it is already known to skip recomputing it from file_path.
+        """
+        entry = self._status_data.get(rel_path or self._get_relative_path(file_path))
+        return entry["enabled"] if entry else False  # Default to disabled if not found
     
-    def get_entry(self, file_path: Path) -> ModStatusEntry | None:
-        """Get mod entry by file path."""
-        rel_path = self._get_relative_path(file_path)
-        for entry in self._status_data:
-            if entry["path"] == rel_path:
-                return entry
-        return None
+    def get_entry(self, file_path: Path, rel_path: str | None = None) -> ModStatusEntry | None:
+        """Get mod entry by file path (or a precomputed rel_path)."""
+        return self._status_data.get(rel_path or self._get_relative_path(file_path))
     
     def set_status(self, file_path: Path, enabled: bool) -> None:
         """Set enabled status for a mod file."""
         rel_path = self._get_relative_path(file_path)
-        for entry in self._status_data:
-            if entry["path"] == rel_path:
+        entry = self._status_data.get(rel_path)
+        if entry is not None:
+            if entry["enabled"] != enabled:
                 entry["enabled"] = enabled
                 self.mark_dirty()
-                return
+            return
         
         # If not found, add new entry
-        current_hash = self._get_file_hash(file_path)
+        st = file_path.stat()
         new_entry: ModStatusEntry = {
             "path": rel_path,
-            "hash": current_hash,
+            "hash": self._get_file_hash(file_path),
             "applied_hash": "",
-            "enabled": enabled
+            "enabled": enabled,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "applied_size": 0,
+            "applied_mtime_ns": 0
         }
-        self._status_data.append(new_entry)
+        self._add_entry(new_entry)
         self.mark_dirty()
     
-    def set_applied_hash(self, file_path: Path, applied_hash: str) -> None:
-        """Set the applied hash for a mod file (hash of mod that was copied to game)."""
-        rel_path = self._get_relative_path(file_path)
-        for entry in self._status_data:
-            if entry["path"] == rel_path:
-                entry["applied_hash"] = applied_hash
-                self.mark_dirty()
-                return
+    def set_applied_hash(self, file_path: Path, applied_hash: str, applied_stat: os.stat_result | None = None) -> None:
+        """Set the applied hash for a mod file (hash of mod that was copied to game).
+        
+        applied_stat is the stat of a game file right after applying, used later to
+        trust applied_hash without rehashing the game file.
+        """
+        entry = self._status_data.get(self._get_relative_path(file_path))
+        if entry is not None:
+            entry["applied_hash"] = applied_hash
+            entry["applied_size"] = applied_stat.st_size if applied_stat else 0
+            entry["applied_mtime_ns"] = applied_stat.st_mtime_ns if applied_stat else 0
+            self.mark_dirty()
+    
+    def update_hash(self, entry: ModStatusEntry, file_hash: str, st: os.stat_result) -> None:
+        """Store a freshly computed mod hash with the size/mtime it was computed for."""
+        entry["hash"] = file_hash
+        entry["size"] = st.st_size
+        entry["mtime_ns"] = st.st_mtime_ns
+        self.mark_dirty()
     
     def get_enabled_mods_with_same_name(self, filename: str, exclude_path: Path | None = None) -> list[ModStatusEntry]:
         """Get all enabled mods with the same filename."""
-        result = []
         exclude_rel = self._get_relative_path(exclude_path) if exclude_path else None
-        for entry in self._status_data:
-            if entry["enabled"] and Path(entry["path"]).name == filename:
-                if exclude_rel and entry["path"] == exclude_rel:
-                    continue
-                result.append(entry)
-        return result
+        return [
+            entry for entry in self._by_name.get(filename, [])
+            if entry["enabled"] and entry["path"] != exclude_rel
+        ]
 
 
 class StellaSoraModLoader:
@@ -279,14 +576,57 @@ class StellaSoraModLoader:
         logger: Callable[[str], None] | None = None
     ) -> None:
         self.game_resource_dir = game_resource_dir
+        # str(game_resource_dir) plus separator, for slicing game file paths to relative parts
+        self._game_prefix = os.path.join(str(game_resource_dir), "")
         self.mods_dir = mods_dir
         self.backups_dir = backups_dir
         self.mod_extension = mod_extension
+        self._is_mod_name = _mod_name_filter(mod_extension)
         self.logger: Callable[[str], None] = logger if logger else lambda msg: None
         self.status_manager = ModsStatusManager(mods_dir, mod_extension)
+        # In-memory hash cache: path -> (size, mtime_ns, inode, hash), kept for the loader's lifetime.
+        # The inode guards against a copy that reproduces both size and mtime (copystat does).
+        self._hash_cache: dict[Path, tuple[int, int, int, str]] = {}
+        # Game files by (normcased) name, built lazily by find_original_files and kept only
+        # until the outermost batched() block exits (a game update can move or delete files)
+        self._game_index: dict[str, list[Path]] | None = None
+        self._batch_depth = 0
+        # Pending log lines while inside _buffered_log(), else None
+        self._log_buffer: list[str] | None = None
+        # Mod list from the walk sync_mods just did, handed to the next get_mods_list once
+        self._synced_mods: list[Path] | None = None
 
     def log(self, message: str) -> None:
-        self.logger(message)
+        if self._log_buffer is not None:
+            self._log_buffer.append(message)
+        else:
+            self.logger(message)
+
+    @contextmanager
+    def _buffered_log(self) -> Iterator[None]:
+        """Collect log lines and hand them to the logger as one message when the outermost block exits."""
+        if self._log_buffer is not None:
+            yield
+            return
+        self._log_buffer = []
+        try:
+            yield
+        finally:
+            lines, self._log_buffer = self._log_buffer, None
+            if lines:
+                self.logger("\n".join(lines))
+
+    @contextmanager
+    def batched(self) -> Iterator[None]:
+        """Group operations: status saved once, game dir indexed at most once for the whole block."""
+        with self.status_manager.batched():
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._game_index = None
 
     def sync_mods(self) -> list[ModStatusEntry]:
         """Sync mod status with actual files in mods_dir.
@@ -294,6 +634,7 @@ class StellaSoraModLoader:
         Returns list of orphaned enabled mods (enabled but file deleted/moved).
         """
         orphaned_enabled_mods = self.status_manager.sync_with_files()
+        self._synced_mods = self.status_manager.scanned_files
         
         # Cleanup empty folders in Backups directory
         self.cleanup_empty_backup_folders()
@@ -316,14 +657,19 @@ class StellaSoraModLoader:
             backup_subdir = self.backups_dir / mod_rel_path.parent
             mod_name = mod_rel_path.name
             
-            if not backup_subdir.exists():
+            # Find backup files matching pattern: {mod_name}.backup.* (one scandir, names
+            # compared with the OS's case rules like glob did)
+            prefix = os.path.normcase(f"{mod_name}.backup.")
+            try:
+                with os.scandir(backup_subdir) as it:
+                    backups_found = [
+                        Path(dir_entry.path) for dir_entry in it
+                        if os.path.normcase(dir_entry.name).startswith(prefix) and dir_entry.is_file()
+                    ]
+            except FileNotFoundError:
                 self.log(f"  - No backup folder for {entry['path']}")
                 continue
             
-            # Find backup files matching pattern: {mod_name}.backup.*
-            pattern = f"{mod_name}.backup.*"
-            backups_found = list(backup_subdir.glob(pattern))
-            
             if not backups_found:
                 self.log(f"  - No backup found for {entry['path']}")
                 continue
@@ -332,10 +678,18 @@ class StellaSoraModLoader:
                 self.restore_backup_file(backup)
 
     def get_mods_list(self) -> list[Path]:
-        pattern = f"*{self.mod_extension}"
-        # Return all mod files, filter out backup files (hidden files starting with dot)
-        all_files = list(self.mods_dir.rglob(pattern))
-        return [f for f in all_files if not f.name.startswith(".")]
+        # Return all mod files, skipping backup files (hidden files starting with dot).
+        # Right after sync_mods, reuse its walk instead of scanning mods_dir again;
+        # the snapshot is used only once so later calls always see the current tree.
+        mods, self._synced_mods = self._synced_mods, None
+        if mods is not None:
+            return mods
+        return list(_iter_files(self.mods_dir, self._is_mod_name))
+
+    def get_enabled_mods(self) -> list[Path]:
+        """Return mod files enabled in the JSON status, in get_mods_list order."""
+        get_status = self.status_manager.get_status
+        return [mod for mod in self.get_mods_list() if get_status(mod)]
 
     def is_disabled(self, path: Path) -> bool:
         """Check if mod is disabled based on JSON status."""
@@ -361,38 +715,49 @@ class StellaSoraModLoader:
         Returns:
             bool: True if operation successful (mod enabled/disabled), False if failed (e.g. checks failed).
         """
-        # Ensure status entry exists before applying mod (needed for set_applied_hash)
-        if enable:
-            entry = self.status_manager.get_entry(mod_path)
-            if not entry:
-                # Create entry with enabled=False first, will be set to True later
-                self.status_manager.set_status(mod_path, False)
-        
-        success = True
-        if enable:
-            success = self._apply_mod(mod_path)
-        else:
-            self._unapply_mod(mod_path)
+        with self.batched(), self._buffered_log():
+            # Ensure status entry exists before applying mod (needed for set_applied_hash)
+            if enable:
+                entry = self.status_manager.get_entry(mod_path)
+                if not entry:
+                    # Create entry with enabled=False first, will be set to True later
+                    self.status_manager.set_status(mod_path, False)
         
-        if success:
-            self.status_manager.set_status(mod_path, enable)
+            success = True
+            if enable:
+                success = self._apply_mod(mod_path)
+            else:
+                self._unapply_mod(mod_path)
+        
+            if success:
+                self.status_manager.set_status(mod_path, enable)
             
-        return success
+            return success
     
     def _get_backup_path(self, mod_file: Path, game_file: Path) -> Path:
         """Get the backup file path in Backups directory with same subfolder structure as Mods."""
+        return self._get_backup_subdir(mod_file) / self._get_backup_name(game_file)
+    
+    def _get_backup_subdir(self, mod_file: Path) -> Path:
+        """Create (if needed) and return the Backups subfolder mirroring the mod's folder in Mods."""
         # Get relative path of mod from mods_dir (e.g. Chitose/char_2d_14401.unity3d)
         mod_relative = mod_file.relative_to(self.mods_dir)
         
         # Create same subfolder structure in Backups
         backup_subdir = self.backups_dir / mod_relative.parent
         backup_subdir.mkdir(parents=True, exist_ok=True)
-        
-        # Backup name: {original_name}.backup.{game_path_parts} (no leading dot)
-        relative_path = game_file.relative_to(self.game_resource_dir).parts
-        backup_file_name = game_file.name + ".backup." + ".".join(relative_path[:-1])
-        
-        return backup_subdir / backup_file_name
+        return backup_subdir
+    
+    def _get_backup_name(self, game_file: Path) -> str:
+        """Backup name: {original_name}.backup.{game_path_parts} (no leading dot)."""
+        # Game files come from the game index, so their paths normally start with the
+        # game dir prefix and can be split as strings instead of via relative_to
+        path_str = str(game_file)
+        if path_str.startswith(self._game_prefix):
+            relative_path = path_str[len(self._game_prefix):].split(os.sep)
+        else:
+            relative_path = list(game_file.relative_to(self.game_resource_dir).parts)
+        return relative_path[-1] + ".backup." + ".".join(relative_path[:-1])
     
     def _apply_mod(self, mod_path: Path) -> bool:
         """Apply mod to game files with hash-based state detection.
@@ -400,8 +765,9 @@ class StellaSoraModLoader:
         Returns:
             bool: True if applied successfully (or already applied), False if game files not found.
         """
-        mod_hash = self.get_file_hash(mod_path)
         entry = self.status_manager.get_entry(mod_path)
+        mod_stat = mod_path.stat()
+        mod_hash = self._get_mod_hash(mod_path, entry, mod_stat)
         applied_hash = entry.get("applied_hash", "") if entry else ""
         
         game_files = self.find_original_files(mod_path)
@@ -411,43 +777,71 @@ class StellaSoraModLoader:
         
         self.log(f"Applying {mod_path.relative_to(self.mods_dir).as_posix()}")
         
+        mod_size = mod_stat.st_size
+        # Stat of game_files[0] after applying; reused when that file is left untouched
+        applied_stat: os.stat_result | None = None
         for game_file in game_files:
-            game_hash = self.get_file_hash(game_file)
+            # Use stat metadata and a short prefix read first; only hash when they can't decide
+            game_stat = game_file.stat()
+            game_hash = self._trusted_applied_hash(entry, game_stat)
+            if game_hash is None and game_stat.st_size == mod_size and _same_prefix(game_file, mod_path):
+                game_hash = self.get_file_hash(game_file)
             backup_path = self._get_backup_path(mod_path, game_file)
             
             # Case 1: mod_hash == game_hash - already applied
             if mod_hash == game_hash:
+                if game_file is game_files[0]:
+                    applied_stat = game_stat
                 self.log(f"  - {game_file.name} ({self._get_folder_name(game_file)}): already applied")
                 continue
             
             # Case 2: No backup exists - backup and apply
             if not backup_path.exists():
-                shutil.copy2(game_file, backup_path)
-                shutil.copy2(mod_path, game_file)
+                _snapshot_file(game_file, backup_path)
+                _fast_copy(mod_path, game_file)
                 self.log(f"  - {game_file.name} ({self._get_folder_name(game_file)}): backed up & applied")
                 continue
             
             # Case 3: Backup exists - check if game has old mod or was updated
-            backup_hash = self.get_file_hash(backup_path)
+            if game_hash is None:
+                game_hash = self.get_file_hash(game_file)
             
             if game_hash == applied_hash and applied_hash:
-                # Game has old mod - restore first then apply new mod
-                shutil.copy2(backup_path, game_file)
-                self.log(f"  - {game_file.name} ({self._get_folder_name(game_file)}): restored old file")
-                # Now backup the restored original and apply new mod
-                shutil.copy2(game_file, backup_path)
-                shutil.copy2(mod_path, game_file)
-                self.log(f"  - {game_file.name} ({self._get_folder_name(game_file)}): applied new mod")
+                # Game has old mod - backup already holds the original, just apply new mod over it
+                _fast_copy(mod_path, game_file)
+                self.log(f"  - {game_file.name} ({self._get_folder_name(game_file)}): replaced old mod")
             else:
                 # Game was updated - re-backup and apply
-                shutil.copy2(game_file, backup_path)
-                shutil.copy2(mod_path, game_file)
+                _snapshot_file(game_file, backup_path)
+                _fast_copy(mod_path, game_file)
                 self.log(f"  - {game_file.name} ({self._get_folder_name(game_file)}): re-backed up & applied")
         
         # Update applied_hash to current mod hash
-        self.status_manager.set_applied_hash(mod_path, mod_hash)
+        if applied_stat is None:
+            applied_stat = game_files[0].stat()
+        self.status_manager.set_applied_hash(mod_path, mod_hash, applied_stat)
         return True
     
+    def _get_mod_hash(self, mod_path: Path, entry: ModStatusEntry | None, mod_stat: os.stat_result) -> str:
+        """Return the mod hash stored in its entry if the file is unchanged, else hash it and store it."""
+        if entry is not None and _hash_is_current(entry, mod_stat):
+            return entry["hash"]
+        mod_hash = self.get_file_hash(mod_path)
+        if entry is not None:
+            self.status_manager.update_hash(entry, mod_hash, mod_stat)
+        return mod_hash
+    
+    def _trusted_applied_hash(self, entry: ModStatusEntry | None, game_stat: os.stat_result) -> str | None:
+        """Return applied_hash if the game file's stat still matches the one recorded at apply time."""
+        if (
+            entry
+            and entry.get("applied_hash")
+            and entry.get("applied_size") == game_stat.st_size
+            and entry.get("applied_mtime_ns") == game_stat.st_mtime_ns
+        ):
+            return entry["applied_hash"]
+        return None
+    
     def _unapply_mod(self, mod_path: Path) -> None:
         """Restore original game files from backup."""
         game_files = self.find_original_files(mod_path)
@@ -457,73 +851,136 @@ class StellaSoraModLoader:
         for game_file in game_files:
             backup_path = self._get_backup_path(mod_path, game_file)
             
-            if backup_path.exists():
-                shutil.copy2(backup_path, game_file)
-                backup_path.unlink()
-                self.log(f"  - {game_file.name} ({self._get_folder_name(game_file)}): restored")
-            else:
+            if not backup_path.is_file():
                 self.log(f"  - {game_file.name} ({self._get_folder_name(game_file)}): no backup found")
+                continue
+            # Any other missing path (e.g. the game folder) raises with its own message
+            _move_file(backup_path, game_file)
+            self.log(f"  - {game_file.name} ({self._get_folder_name(game_file)}): restored")
         
         # Clear applied_hash
         self.status_manager.set_applied_hash(mod_path, "")
 
-    def verify_enabled_mods(self) -> None:
+    def verify_enabled_mods(self, enabled_mods: list[Path] | None = None) -> None:
         """Verify all enabled mods are properly applied to game files.
         
         For each enabled mod, check if mod_hash == game_hash.
         If not, re-apply the mod.
+        
+        Pass enabled_mods when the caller already has the list from get_enabled_mods()
+        to skip walking mods_dir again.
         """
-        mods = self.get_mods_list()
-        enabled_mods = [m for m in mods if not self.is_disabled(m)]
+        with self.batched():
+            if enabled_mods is None:
+                enabled_mods = self.get_enabled_mods()
         
-        if not enabled_mods:
-            self.log("No enabled mods to verify.")
-            return
+            if not enabled_mods:
+                self.log("No enabled mods to verify.")
+                return
         
-        self.log("Verifying enabled mods...")
+            self.log("Verifying enabled mods...")
         
-        for mod_path in enabled_mods:
-            mod_hash = self.get_file_hash(mod_path)
-            game_files = self.find_original_files(mod_path)
+            # Decide game file state from stat metadata where possible, hash the rest
+            # (all enabled mods plus ambiguous game files) concurrently, then compare serially
+            game_files_by_mod = {mod_path: self.find_original_files(mod_path) for mod_path in enabled_mods}
+            known_hashes: dict[Path, str] = {}
+            files_to_hash: list[Path] = []
+            stale_mods: list[tuple[Path, ModStatusEntry, os.stat_result]] = []
+            # Mods with a game file of different size or header; decided per mod, since
+            # the same game file may still match another mod targeting it
+            mismatched_mods: set[Path] = set()
+            for mod_path, game_files in game_files_by_mod.items():
+                entry = self.status_manager.get_entry(mod_path)
+                mod_stat = mod_path.stat()
+                mod_size = mod_stat.st_size
+                if entry is not None and _hash_is_current(entry, mod_stat):
+                    known_hashes[mod_path] = entry["hash"]  # Fresh from sync_with_files
+                else:
+                    files_to_hash.append(mod_path)
+                    if entry is not None:
+                        stale_mods.append((mod_path, entry, mod_stat))
+                for game_file in game_files:
+                    try:
+                        game_stat = game_file.stat()
+                    except FileNotFoundError:
+                        continue
+                    trusted_hash = self._trusted_applied_hash(entry, game_stat)
+                    if trusted_hash is not None:
+                        known_hashes[game_file] = trusted_hash
+                    elif game_stat.st_size != mod_size or not _same_prefix(game_file, mod_path):
+                        mismatched_mods.add(mod_path)  # Different size or header, can't match the mod
+                    else:
+                        files_to_hash.append(game_file)
+            hashes = hash_files(files_to_hash, self.get_file_hash)
+            hashes.update(known_hashes)
+            for mod_path, entry, mod_stat in stale_mods:
+                self.status_manager.update_hash(entry, hashes[mod_path], mod_stat)
+        
+            for mod_path in enabled_mods:
+                mod_hash = hashes[mod_path]
+                game_files = game_files_by_mod[mod_path]
             
-            needs_reapply = False
-            for game_file in game_files:
-                if not game_file.exists():
-                    continue
-                game_hash = self.get_file_hash(game_file)
-                if mod_hash != game_hash:
-                    needs_reapply = True
-                    break
+                # Game files missing from hashes were deleted since indexing; skip them
+                needs_reapply = mod_path in mismatched_mods or any(
+                    game_file in hashes and hashes[game_file] != mod_hash
+                    for game_file in game_files
+                )
             
-            if needs_reapply:
-                self.log(f"Applying {mod_path.relative_to(self.mods_dir).as_posix()}...")
-                self._apply_mod(mod_path)
-            else:
-                self.log(f"Verified: {mod_path.relative_to(self.mods_dir).as_posix()}")
+                if needs_reapply:
+                    self.log(f"Applying {mod_path.relative_to(self.mods_dir).as_posix()}...")
+                    with self._buffered_log():
+                        self._apply_mod(mod_path)
+                else:
+                    self.log(f"Verified: {mod_path.relative_to(self.mods_dir).as_posix()}")
 
     def install_mod(self) -> None:
-        mods = self.get_mods_list()
-        active_mods = [m for m in mods if not self.is_disabled(m)]
+        with self.batched():
+            active_mods = self.get_enabled_mods()
+
+            # Hash every game file that could equal its mod concurrently up front (warming
+            # get_file_hash's cache); the copy loop below then stays serial, since mods can
+            # share game files and the status/log state isn't thread-safe
+            candidates: list[Path] = []
+            for mod_file in active_mods:
+                mod_size = mod_file.stat().st_size
+                for original_file in self.find_original_files(mod_file):
+                    if original_file.stat().st_size == mod_size and _same_prefix(original_file, mod_file):
+                        candidates.append(original_file)
+            hash_files(candidates, self.get_file_hash)
 
-        for mod_file in active_mods:
-            self.log(f"Installing {mod_file.relative_to(self.mods_dir).as_posix()}")
-            backedup_files = self.backup_original_files(mod_file)
-            for target_file in backedup_files.keys():
-                shutil.copy2(mod_file, target_file)
-                self.log(f"  - {target_file.name} ({self._get_folder_name(target_file)})")
+            for mod_file in active_mods:
+                with self._buffered_log():
+                    self.log(f"Installing {mod_file.relative_to(self.mods_dir).as_posix()}")
+                    backedup_files = self.backup_original_files(mod_file)
+                    for target_file in backedup_files.keys():
+                        _fast_copy(mod_file, target_file)
+                        self.log(f"  - {target_file.name} ({self._get_folder_name(target_file)})")
 
     def backup_original_files(self, mod_file: Path) -> dict[Path, list[Path]]:
         from collections import defaultdict
         backedup_files = defaultdict(list)
         original_files = self.find_original_files(mod_file)
+        mod_stat = mod_file.stat()
+        mod_hash: str | None = None  # Computed on the first same-size game file
+        backup_subdir: Path | None = None  # Created on the first game file that needs a backup
 
         for original_file in original_files:
-            if self.get_file_hash(original_file) == self.get_file_hash(mod_file):
+            # Different size or leading bytes can't be the same content; only hash game files that could match
+            # A hard link to the mod itself is the same content without reading either side
+            original_stat = original_file.stat()
+            same_content = os.path.samestat(original_stat, mod_stat)
+            if not same_content and original_stat.st_size == mod_stat.st_size and _same_prefix(original_file, mod_file):
+                if mod_hash is None:
+                    mod_hash = self._get_mod_hash(mod_file, self.status_manager.get_entry(mod_file), mod_stat)
+                same_content = self.get_file_hash(original_file) == mod_hash
+            if same_content:
                 self.log(f"  - Skip backing up {original_file.name} ({self._get_folder_name(original_file)}: same content)")
                 continue
 
-            backup_path = self._get_backup_path(mod_file, original_file)
-            shutil.copy2(original_file, backup_path)
+            if backup_subdir is None:
+                backup_subdir = self._get_backup_subdir(mod_file)
+            backup_path = backup_subdir / self._get_backup_name(original_file)
+            _snapshot_file(original_file, backup_path)
 
             backedup_files[original_file].append(backup_path)
             self.log(f"  - Backed up {original_file.name} ({self._get_folder_name(original_file)})")
@@ -532,34 +989,31 @@ class StellaSoraModLoader:
     def restore_all(self) -> None:
         # Restore for all mods from Backups directory
         self.log("Restoring original files...")
-        backup_files = list(self.backups_dir.rglob("*.backup.*"))
-        for backup in backup_files:
-             self.restore_backup_file(backup)
+        backup_files = list(_iter_files(self.backups_dir, _is_backup_name))
+        with self._buffered_log():
+            for backup in backup_files:
+                self.restore_backup_file(backup)
 
     def restore_backup_file(self, backup: Path) -> None:
         # Extract original info from backup name
         # Name format: {original_name}.backup.{path_parts_joined_by_dots}
         # e.g. mod.unity3d.backup.Folder1.Folder2
 
-        backup_name = backup.name
         # Remove leading dot if present (for legacy backups)
-        if backup_name.startswith("."):
-            backup_name = backup_name[1:]
+        backup_name = backup.name.removeprefix(".")
 
-        parts = backup_name.split(".backup.")
-        if len(parts) != 2:
+        original_name, sep, path_suffix = backup_name.partition(".backup.")
+        if not original_name or not sep:
             return
 
-        original_name = parts[0]
-        path_suffix = parts[1]
-
-        relative_parts = [part for part in path_suffix.split(".") if part]
-        target_path = self.game_resource_dir.joinpath(*relative_parts, original_name)
+        target_path = Path(self.game_resource_dir, *filter(None, path_suffix.split(".")), original_name)
 
-        if target_path.exists() or target_path.parent.exists():
-             shutil.copy2(backup, target_path)
-             backup.unlink()
-             self.log(f"  - Restored {target_path.name} ({self._get_folder_name(target_path)})")
+        if target_path.parent.exists():
+            _move_file(backup, target_path)
+            self.log(f"  - Restored {target_path.name} ({self._get_folder_name(target_path)})")
+        else:
+            # Don't recreate game folders the game itself removed; keep the backup instead
+            self.log(f"  - Skipped {target_path.name}: game folder no longer exists, backup kept")
 
     def find_original_files(self, mod_file: Path) -> list[Path]:
         # Logic: find files in game dir with same name as mod file
@@ -567,10 +1021,33 @@ class StellaSoraModLoader:
         # The original logic used mod_file.name.
         # If we rename the mod file to DISABLED_..., we probably shouldn't install it anyway.
         # So install_mod only iterates active mods.
-        return list(self.game_resource_dir.rglob(mod_file.name))
+        index = self._game_index
+        if index is None:
+            index = self._build_game_index()
+        return index.get(os.path.normcase(mod_file.name), [])
+    
+    def _build_game_index(self) -> dict[str, list[Path]]:
+        """Walk game_resource_dir once and index mod-extension files by name.
+        
+        The index is only kept inside batched(); outside it every lookup walks afresh.
+        """
+        index: dict[str, list[Path]] = {}
+        for game_file in _iter_files(self.game_resource_dir, self._is_mod_name):
+            index.setdefault(os.path.normcase(game_file.name), []).append(game_file)
+        if self._batch_depth:
+            self._game_index = index
+        return index
 
     def get_file_hash(self, file_path: Path) -> str:
-        return hashlib.sha256(file_path.read_bytes()).hexdigest()
+        """Get SHA256 hash of a file, reusing the cached hash if size/mtime/inode are unchanged."""
+        st = file_path.stat()
+        key = (st.st_size, st.st_mtime_ns, st.st_ino)
+        cached = self._hash_cache.get(file_path)
+        if cached and cached[:3] == key:
+            return cached[3]
+        file_hash = hash_file(file_path)
+        self._hash_cache[file_path] = (*key, file_hash)
+        return file_hash
     
     def _get_folder_name(self, path: Path) -> str:
         return path.relative_to(self.game_resource_dir).parts[0]
@@ -580,37 +1057,64 @@ class StellaSoraModLoader:
         if not self.backups_dir.exists():
             return
         
-        # Walk directory tree bottom-up to remove empty folders
-        for folder in sorted(self.backups_dir.rglob("*"), key=lambda p: len(p.parts), reverse=True):
-            if folder.is_dir():
-                try:
-                    # Check if folder is empty
-                    if not any(folder.iterdir()):
-                        folder.rmdir()
-                except (OSError, PermissionError):
-                    pass  # Ignore errors when removing folders
+        # Walk directory tree bottom-up to remove empty folders. Children are visited first,
+        # so a folder holding only empty folders is empty by the time it is reached; rmdir
+        # itself refuses non-empty folders, so only folders with files are skipped up front.
+        root = str(self.backups_dir)
+        for dirpath, _dirnames, filenames in os.walk(root, topdown=False):
+            if filenames or dirpath == root:
+                continue
+            try:
+                os.rmdir(dirpath)
+            except OSError:
+                pass  # Not empty or can't be removed
     
 class StellaSoraGame:
     def __init__(self, game_exe_path: Path) -> None:
         self.game_exe_path = Path(game_exe_path)
+        # Lowercased exe name, compared against every process name while scanning
+        self._exe_name = self.game_exe_path.name.lower()
+        # Last matching process; revalidated with a single is_running() check
+        self._cached_proc: psutil.Process | None = None
 
     def start(self) -> None:
         logger.info(f"Starting game: {self.game_exe_path}")
+        if sys.platform == "win32":
+            # ShellExecute directly (what `start` does) without spawning cmd.exe; also
+            # handles UAC elevation and needs no quoting
+            os.startfile(self.game_exe_path)
+            return
         subprocess.Popen(
-            f'start "" "{self.game_exe_path}"',
-            shell=True,
+            [str(self.game_exe_path)],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
             stdin=subprocess.DEVNULL,
+            start_new_session=True,
         )
 
     def get_process(self) -> psutil.Process | None:
-        for proc in psutil.process_iter(['name']):
+        if self._cached_proc is not None:
             try:
-                if proc.info['name'] and proc.info['name'].lower() == self.game_exe_path.name.lower():
-                    return proc
+                if (
+                    self._cached_proc.is_running()
+                    and self._cached_proc.name().lower() == self._exe_name
+                ):
+                    return self._cached_proc
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 pass
+            self._cached_proc = None
+        
+        # Cache miss - scan the process table. Query name() directly instead of passing
+        # attrs, which builds an info dict through as_dict() for every process.
+        exe_name = self._exe_name
+        for proc in psutil.process_iter():
+            try:
+                name = proc.name()
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+            if name and name.lower() == exe_name:
+                self._cached_proc = proc
+                return proc
         return None
 
     def is_running(self) -> bool:
@@ -619,23 +1123,30 @@ class StellaSoraGame:
         return running
 
     def wait_for_game_closed(self) -> bool:
-        proc = None
-        for _ in range(30): # Wait up to 30s for game to start
+        # Wait up to 30s for game to start, backing off from 10ms to 1s between checks
+        proc = self.get_process()
+        delay = 0.01
+        deadline = time.monotonic() + 30
+        while not proc and time.monotonic() < deadline:
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
             proc = self.get_process()
-            if proc:
-                break
-            time.sleep(1)
 
         if not proc:
             return False
 
-        try:
-            proc.wait()
-        except psutil.NoSuchProcess:
-            pass
-
-        # Double check
-        while self.is_running():
-            time.sleep(1)
+        # proc.wait() blocks in the kernel until exit (WaitForSingleObject on Windows), no
+        # polling needed. Afterwards a single scan catches the game relaunching itself
+        # under a new PID.
+        while proc:
+            try:
+                proc.wait()
+            except psutil.NoSuchProcess:
+                pass
+            except psutil.Error:
+                # No handle with wait access (e.g. an elevated game): poll instead
+                while proc.is_running():
+                    time.sleep(1)
+            proc = self.get_process()
 
         return True
\ No newline at end of file
@@ -9,6 +9,20 @@ from types import TracebackType
 MUTEX_ALL_ACCESS = 0x1F0001
 ERROR_ALREADY_EXISTS = 183
 
+if sys.platform == "win32":
+    # Bound once with prototypes: a HANDLE restype keeps 64-bit handles intact, and
+    # use_last_error makes the error code reliable via ctypes.get_last_error()
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _CreateMutexW = _kernel32.CreateMutexW
+    _CreateMutexW.argtypes = (wintypes.LPVOID, wintypes.BOOL, wintypes.LPCWSTR)
+    _CreateMutexW.restype = wintypes.HANDLE
+    _ReleaseMutex = _kernel32.ReleaseMutex
+    _ReleaseMutex.argtypes = (wintypes.HANDLE,)
+    _ReleaseMutex.restype = wintypes.BOOL
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = (wintypes.HANDLE,)
+    _CloseHandle.restype = wintypes.BOOL
+
 
 class SingleInstanceLock:
     """
@@ -33,20 +47,18 @@ class SingleInstanceLock:
         
         try:
             # Try to create a named mutex
-            kernel32 = ctypes.windll.kernel32
-            
-            self.mutex_handle = kernel32.CreateMutexW(
+            self.mutex_handle = _CreateMutexW(
                 None,  # default security attributes
                 True,  # initially owned
                 self.name  # mutex name
             )
             
-            last_error = kernel32.GetLastError()
+            last_error = ctypes.get_last_error()
             
             if last_error == ERROR_ALREADY_EXISTS:
                 # Another instance is already running
                 if self.mutex_handle:
-                    kernel32.CloseHandle(self.mutex_handle)
+                    _CloseHandle(self.mutex_handle)
                     self.mutex_handle = None
                 return False
             
@@ -61,9 +73,8 @@ class SingleInstanceLock:
         """Release the single instance lock."""
         if self.mutex_handle and sys.platform == "win32":
             try:
-                kernel32 = ctypes.windll.kernel32
-                kernel32.ReleaseMutex(self.mutex_handle)
-                kernel32.CloseHandle(self.mutex_handle)
+                _ReleaseMutex(self.mutex_handle)
+                _CloseHandle(self.mutex_handle)
             except Exception:
                 pass
             finally:
@@ -61,8 +61,7 @@ class GameLauncher:
                 return False, f"Found {len(orphaned)} orphaned mod(s) that need attention"
             
             # Check for conflicts in enabled mods
-            mods = loader.get_mods_list()
-            enabled_mods = [m for m in mods if not loader.is_disabled(m)]
+            enabled_mods = loader.get_enabled_mods()
             
             for mod in enabled_mods:
                 conflicts = loader.check_duplicate_conflict(mod)
@@ -73,7 +72,7 @@ class GameLauncher:
             
             # Verify enabled mods are applied
             logger.debug("Quick launch: verifying enabled mods")
-            loader.verify_enabled_mods()
+            loader.verify_enabled_mods(enabled_mods)
             
         except Exception as e:
             logger.error(f"Quick launch: Error during mod verification - {e}", exc_info=True)
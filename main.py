@@ -6,17 +6,13 @@ import argparse
 from types import TracebackType
 from typing import TYPE_CHECKING
 
-from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtCore import QLocale
-
 if TYPE_CHECKING:
     from PySide6.QtWidgets import QWidget
 
 from instance_lock import SingleInstanceLock, find_and_focus_existing_window
-from updater import is_running_as_exe
 
-# Force English locale for consistent number formatting (prevent ๘๙% instead of 89%)
-QLocale.setDefault(QLocale(QLocale.Language.English, QLocale.Country.UnitedStates))
+# PySide6 (and the updater's requests import) are loaded only once the UI is actually
+# needed, so --quicklaunch doesn't pay for them
 
 
 def setup_logging():
@@ -53,6 +49,8 @@ def global_exception_handler(
 def show_error_dialog(title: str, message: str):
     """Show error dialog even if QApplication is not yet created"""
     try:
+        from PySide6.QtWidgets import QApplication, QMessageBox
+        
         # Try to get existing QApplication
         app = QApplication.instance()
         if app is None:
@@ -146,6 +144,12 @@ def main():
         
         # Normal startup - create Qt application
         logging.info("Creating Qt application")
+        from PySide6.QtWidgets import QApplication
+        from PySide6.QtCore import QLocale
+        from updater import is_running_as_exe
+        
+        # Force English locale for consistent number formatting (prevent ๘๙% instead of 89%)
+        QLocale.setDefault(QLocale(QLocale.Language.English, QLocale.Country.UnitedStates))
         app = QApplication(sys.argv)
         app.setQuitOnLastWindowClosed(False)
         
@@ -246,11 +246,12 @@ class SettingsDialog(QDialog):
             self.update_btn.setText("Check for Updates")
 
     def save_settings(self):
-        self.vm.set_game_path(self.game_path_edit.text())
-        self.vm.set_mods_dir(self.mods_dir_edit.text())
-        self.vm.set_backups_dir(self.backups_dir_edit.text())
-        self.vm.set_mod_ext(self.mod_ext_edit.text())
-        self.vm.set_minimize_to_tray(self.minimize_to_tray_chk.isChecked())
-        self.vm.set_non_permanent_mode(self.non_permanent_chk.isChecked())
+        with self.vm.batch():
+            self.vm.set_game_path(self.game_path_edit.text())
+            self.vm.set_mods_dir(self.mods_dir_edit.text())
+            self.vm.set_backups_dir(self.backups_dir_edit.text())
+            self.vm.set_mod_ext(self.mod_ext_edit.text())
+            self.vm.set_minimize_to_tray(self.minimize_to_tray_chk.isChecked())
+            self.vm.set_non_permanent_mode(self.non_permanent_chk.isChecked())
         self.accept()
 
@@ -15,18 +15,16 @@ FolderNode = dict[str, Any]  # {"_mods": list[ModData], "subfolder_name": Folder
 
 def load_stylesheet() -> str:
     """Load the QSS stylesheet from embedded resource."""
-    style_path = get_resource_path("styles.qss")
-    if style_path.exists():
-        stylesheet = style_path.read_text(encoding="utf-8")
-        
-        # Replace relative paths with absolute paths for resources
-        # This is needed because when running as Nuitka onefile, the QSS relative paths
-        # resolve against the CWD (executable dir), not the temp dir where resources are.
-        resources_path = get_resource_path("resources").as_posix()
-        stylesheet = stylesheet.replace("url(resources/", f"url({resources_path}/")
-        
-        return stylesheet
-    return ""
+    try:
+        stylesheet = get_resource_path("styles.qss").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return ""
+    
+    # Replace relative paths with absolute paths for resources
+    # This is needed because when running as Nuitka onefile, the QSS relative paths
+    # resolve against the CWD (executable dir), not the temp dir where resources are.
+    resources_path = get_resource_path("resources").as_posix()
+    return stylesheet.replace("url(resources/", f"url({resources_path}/")
 
 
 def get_app_icon_path() -> Path:
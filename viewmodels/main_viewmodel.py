@@ -27,15 +27,16 @@ class MainViewModel(QObject):
         self.launcher_thread = None
 
     def _ensure_defaults(self):
-        if not self.config.ModsDir.get():
-            default_mods = get_exe_path("Mods")
-            default_mods.mkdir(parents=True, exist_ok=True)
-            self.config.ModsDir.set(default_mods.as_posix())
-        
-        if not self.config.BackupsDir.get():
-            default_backups = get_exe_path("Backups")
-            default_backups.mkdir(parents=True, exist_ok=True)
-            self.config.BackupsDir.set(default_backups.as_posix())
+        with self.config.batch():
+            if not self.config.ModsDir.get():
+                default_mods = get_exe_path("Mods")
+                default_mods.mkdir(parents=True, exist_ok=True)
+                self.config.ModsDir.set(default_mods.as_posix())
+            
+            if not self.config.BackupsDir.get():
+                default_backups = get_exe_path("Backups")
+                default_backups.mkdir(parents=True, exist_ok=True)
+                self.config.BackupsDir.set(default_backups.as_posix())
 
     def reload_config(self):
         self.config.reload()
@@ -82,12 +83,12 @@ class MainViewModel(QObject):
         mods = self.loader.get_mods_list()
         mod_data: list[ModData] = []
         for mod in mods:
-            is_disabled = self.loader.is_disabled(mod)
+            relative_path = mod.relative_to(self.loader.mods_dir).as_posix()
             mod_data.append({
                 "name": mod.name,
-                "enabled": not is_disabled,
+                "enabled": self.loader.status_manager.get_status(mod, relative_path),
                 "path": mod,
-                "relative_path": mod.relative_to(self.loader.mods_dir).as_posix()
+                "relative_path": relative_path
             })
         self.mods_list_changed.emit(mod_data)
 
@@ -128,17 +129,19 @@ class MainViewModel(QObject):
             count = 0
             non_permanent = self.config.NonPermanentMode.get() or False
             
-            for mod in mods:
-                is_currently_enabled = not self.loader.is_disabled(mod)
-                if is_currently_enabled != enable:
-                    if non_permanent:
-                        # Non-permanent mode: only update JSON status, don't touch game files
-                        self.loader.status_manager.set_status(mod, enable)
-                        count += 1
-                    else:
-                        # Normal mode: apply/unapply mod to game files
-                        if self.loader.toggle_mod(mod, enable):
+            # Batch so the status file is written once and the game dir indexed once for all toggles
+            with self.loader.batched():
+                for mod in mods:
+                    is_currently_enabled = not self.loader.is_disabled(mod)
+                    if is_currently_enabled != enable:
+                        if non_permanent:
+                            # Non-permanent mode: only update JSON status, don't touch game files
+                            self.loader.status_manager.set_status(mod, enable)
                             count += 1
+                        else:
+                            # Normal mode: apply/unapply mod to game files
+                            if self.loader.toggle_mod(mod, enable):
+                                count += 1
             
             if count > 0:
                 msg = "enabled" if enable else "disabled"
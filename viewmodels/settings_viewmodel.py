@@ -1,4 +1,6 @@
 """Settings dialog ViewModel."""
+from contextlib import AbstractContextManager
+
 from PySide6.QtCore import QObject
 
 from core import Config
@@ -11,6 +13,10 @@ class SettingsViewModel(QObject):
         super().__init__()
         self.config = Config('config.ini')
 
+    def batch(self) -> AbstractContextManager[None]:
+        """Group several setters into a single config file write."""
+        return self.config.batch()
+
     def get_game_path(self) -> str:
         return self.config.GameExePath.get() or ""
 
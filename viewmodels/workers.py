@@ -16,6 +16,13 @@ class GameLauncherWorker(QThread):
         self.config = config
 
     def run(self):
+        # Always report completion, so the UI never stays stuck on "running"
+        try:
+            self._run()
+        finally:
+            self.finished_signal.emit()
+
+    def _run(self):
         game_exe = Path(self.config.GameExePath.get() or "")
         mods_dir = Path(self.config.ModsDir.get() or "")
         backups_dir = Path(self.config.BackupsDir.get() or "")
@@ -26,7 +33,6 @@ class GameLauncherWorker(QThread):
 
         if game.is_running():
             self.log_message("Game is already running! Please close it first.")
-            self.finished_signal.emit()
             return
 
         # Sync mods and handle orphaned ones before launch
@@ -36,7 +42,6 @@ class GameLauncherWorker(QThread):
                 loader.restore_orphaned_backups(orphaned)
         except Exception as e:
             self.log_message(f"Error syncing mods: {e}")
-            self.finished_signal.emit()
             return
 
         # Verify that enabled mods are properly applied (hash check)
@@ -44,7 +49,6 @@ class GameLauncherWorker(QThread):
             loader.verify_enabled_mods()
         except Exception as e:
             self.log_message(f"Error verifying mods: {e}")
-            self.finished_signal.emit()
             return
 
         self.log_message("Starting game...")
@@ -61,8 +65,6 @@ class GameLauncherWorker(QThread):
                 self.log_message("Original files restored.")
         else:
             self.log_message("Could not detect game process start.")
-        
-        self.finished_signal.emit()
 
     def log_message(self, msg: str) -> None:
         self.log_signal.emit(msg)
@@ -81,9 +83,12 @@ class GameMonitorWorker(QThread):
         game_exe = Path(self.config.GameExePath.get() or "")
         game = StellaSoraGame(game_exe)
         
-        # Wait for game to close
-        while game.is_running():
-            self.msleep(1000)  # Check every second
-        
-        self.log_signal.emit("Game closed detected.")
-        self.finished_signal.emit()
+        try:
+            # Wait for game to close (a kernel wait on the process handle instead of a
+            # once-a-second process scan); skipped if it already exited in the meantime
+            if game.is_running():
+                game.wait_for_game_closed()
+            
+            self.log_signal.emit("Game closed detected.")
+        finally:
+            self.finished_signal.emit()